@@ -1,20 +1,62 @@
 """Audio recording module using sounddevice."""
 
-import queue
+import math
 import subprocess
 import tempfile
 import threading
+import time
+from collections import deque
 from dataclasses import dataclass
-from datetime import datetime
 from enum import Enum, auto
 from pathlib import Path
-from typing import Callable, Optional
+from typing import TYPE_CHECKING, Callable, Optional
 
 import numpy as np
-import sounddevice as sd
-import soundfile as sf
 
-from .config import CHANNELS, QualitySettings, get_quality_settings
+# sounddevice and soundfile dlopen PortAudio/libsndfile on import, so they
+# are imported where first used to keep application start-up fast
+if TYPE_CHECKING:
+    import sounddevice as sd
+    import soundfile as sf
+
+from .config import (
+    CAPTURE_SLAB_SECONDS,
+    CAPTURE_SPOOL_INTERVAL_SECONDS,
+    CHANNELS,
+    SAMPLE_DTYPE,
+    QualitySettings,
+    get_quality_settings,
+)
+
+# Resolved once so the audio callback never parses the dtype string
+_SAMPLE_DTYPE = np.dtype(SAMPLE_DTYPE)
+
+# Level kernels. Recording is always mono (CHANNELS = 1), so a block is a
+# flat run of samples and the whole block is a single RMS window: one
+# reduction per callback, no per-channel or frame-wise windowing needed.
+
+# Level reported for a block of digital silence
+_SILENCE_DB = -100.0
+
+
+def _sumsq_to_db(sumsq: float, n: int, max_val: float) -> float:
+    """Convert a block's sum of squares to an RMS level in dBFS."""
+    if sumsq <= 0:
+        return _SILENCE_DB
+    return 20 * math.log10(math.sqrt(sumsq / n) / max_val)
+
+
+def _rms_db_int16(x: np.ndarray, scratch: np.ndarray) -> float:
+    """
+    RMS level (dBFS) of 16-bit signed samples: -32768 to 32767.
+
+    Converts into a caller-owned float64 scratch buffer (reused every block,
+    so nothing is allocated) and reduces it with a BLAS dot. float64 holds
+    these sums exactly; np.dot on the raw int16 would overflow.
+    """
+    v = scratch[:x.size]
+    np.copyto(v, x)
+    return _sumsq_to_db(float(np.dot(v, v)), x.size, 32768.0)
 
 
 class RecordingState(Enum):
@@ -44,25 +86,40 @@ class AudioRecorder:
 
     def __init__(
         self,
-        level_callback: Optional[Callable[[float], None]] = None,
         quality_settings: Optional[QualitySettings] = None,
+        state_callback: Optional[Callable[[RecordingState], None]] = None,
     ):
         """
         Initialize the recorder.
 
         Args:
-            level_callback: Optional callback for audio level updates (dB value)
             quality_settings: Audio quality settings (defaults to default preset)
+            state_callback: Optional callback invoked with the new state on
+                every state transition
         """
         self._state = RecordingState.IDLE
-        self._audio_queue: queue.Queue = queue.Queue()
-        self._recorded_frames: list[np.ndarray] = []
-        self._stream: Optional[sd.InputStream] = None
-        self._recording_thread: Optional[threading.Thread] = None
-        self._level_callback = level_callback
+        self._state_callback = state_callback
+        # Captured audio: full slabs followed by the slab being written.
+        # Only the audio callback writes to the last slab and _write_idx;
+        # the spool thread moves full slabs to a temp WAV and recycles one
+        # as the spare, so memory stays bounded whatever the take length.
+        self._slabs: deque[np.ndarray] = deque()
+        self._spare_slab: Optional[np.ndarray] = None
+        self._write_idx = 0
+        self._total_frames = 0
+        self._wav: Optional["sf.SoundFile"] = None
+        self._wav_path: Optional[Path] = None
+        self._spool_thread: Optional[threading.Thread] = None
+        self._spool_stop = threading.Event()
+        self._stream: Optional["sd.RawInputStream"] = None
+        # Latest input level (dB), stored by the audio callback and polled
+        # by the UI; a single store is atomic under the GIL. None until a
+        # block has been metered, so pollers never read a placeholder level.
+        self._latest_db: Optional[float] = None
+        self._meter_enabled = True
+        self._scratch = np.empty(0, dtype=np.float64)  # Sized per stream in start()
         self._device_index: Optional[int] = None
-        self._lock = threading.Lock()
-        self._quality = quality_settings or get_quality_settings()
+        self.set_quality(quality_settings or get_quality_settings())
 
     def set_quality(self, quality_settings: QualitySettings) -> None:
         """
@@ -74,6 +131,14 @@ class AudioRecorder:
             raise RuntimeError("Cannot change quality while recording")
         self._quality = quality_settings
 
+    def _set_state(self, state: RecordingState) -> None:
+        """Switch state, notifying the state callback on a change."""
+        if state == self._state:
+            return
+        self._state = state
+        if self._state_callback:
+            self._state_callback(state)
+
     @property
     def state(self) -> RecordingState:
         """Current recording state."""
@@ -84,9 +149,27 @@ class AudioRecorder:
         """Current quality settings."""
         return self._quality
 
+    def set_meter_enabled(self, enabled: bool) -> None:
+        """Enable or disable level computation (e.g. while the UI is hidden)."""
+        if enabled and not self._meter_enabled:
+            # Whatever was stored before metering stopped is stale
+            self._latest_db = None
+        self._meter_enabled = enabled
+
+    def get_level_db(self) -> Optional[float]:
+        """
+        Latest input level in dB (updated once per audio block).
+
+        None until the first block is metered after the stream opens or
+        metering is re-enabled.
+        """
+        return self._latest_db
+
     @staticmethod
     def list_devices() -> list[AudioDevice]:
         """List available audio input devices."""
+        import sounddevice as sd
+
         devices = []
         default_device = sd.default.device[0]  # Input device index
 
@@ -111,114 +194,180 @@ class AudioRecorder:
         """
         self._device_index = device_index
 
-    def _audio_callback(self, indata: np.ndarray, frames: int,
-                        time_info: dict, status: sd.CallbackFlags) -> None:
-        """Callback for audio stream - runs in separate thread."""
+    def _audio_callback(self, indata, frames: int,
+                        time_info: dict, status: "sd.CallbackFlags") -> None:
+        """
+        Callback for audio stream - runs in separate thread.
+
+        indata is the raw PortAudio buffer; it is wrapped as a numpy view
+        once here (mono, so no reshaping) and shared by the meter and capture.
+        """
         if status:
             print(f"Audio callback status: {status}")
 
-        # Always calculate level for meter (even when paused)
-        if self._level_callback:
-            # Calculate RMS and convert to dB
-            # Normalize based on bit depth
-            if self._quality.sample_width == 1:
-                # 8-bit unsigned: 0-255, center at 128
-                rms = np.sqrt(np.mean((indata.astype(np.float32) - 128) ** 2))
-                max_val = 128
-            else:
-                # 16-bit signed: -32768 to 32767
-                rms = np.sqrt(np.mean(indata.astype(np.float32) ** 2))
-                max_val = 32768
-
-            if rms > 0:
-                db = 20 * np.log10(rms / max_val)
-            else:
-                db = -100
-            self._level_callback(db)
-
-        # Only queue audio if actively recording (not paused)
-        if self._state == RecordingState.RECORDING:
-            self._audio_queue.put(indata.copy())
-
-    def _recording_loop(self) -> None:
-        """Background thread that collects audio from queue."""
-        while self._state in (RecordingState.RECORDING, RecordingState.PAUSED):
-            try:
-                data = self._audio_queue.get(timeout=0.1)
-                if self._state == RecordingState.RECORDING:
-                    with self._lock:
-                        self._recorded_frames.append(data)
-            except queue.Empty:
-                continue
+        # Only capture audio if actively recording (not paused)
+        recording = self._state == RecordingState.RECORDING
+        if not (recording or self._meter_enabled):
+            return  # Paused and hidden: nothing needs the samples
+
+        block = np.frombuffer(indata, dtype=_SAMPLE_DTYPE, count=frames)
+
+        # Calculate level for meter (even when paused) unless nobody can see it
+        if self._meter_enabled:
+            self._latest_db = _rms_db_int16(block, self._scratch)
+
+        if recording:
+            self._capture(block)
+            self._total_frames += frames
+
+    def _capture(self, block: np.ndarray) -> None:
+        """
+        Copy a block into the capture slabs.
+
+        Runs on the audio thread: no locks, and no allocation unless the
+        spool thread has fallen behind and not yet recycled a spare slab.
+        """
+        n = len(block)
+        pos = self._write_idx
+        slab = self._slabs[-1]
+        space = len(slab) - pos
+
+        if n <= space:
+            slab[pos:pos + n] = block
+            self._write_idx = pos + n
+            return
+
+        # Current slab is full: spill the remainder into the spare slab
+        slab[pos:] = block[:space]
+        spare = self._spare_slab
+        self._spare_slab = None
+        if spare is None:
+            spare = np.empty_like(slab)
+        spare[:n - space] = block[space:]
+        self._slabs.append(spare)
+        self._write_idx = n - space
+
+    def _spool_loop(self) -> None:
+        """Background thread that moves full slabs from memory to disk."""
+        while not self._spool_stop.wait(CAPTURE_SPOOL_INTERVAL_SECONDS):
+            self._spool_full_slabs()
+
+    def _spool_full_slabs(self) -> None:
+        """Write every full slab to the temp WAV, keeping one as the spare."""
+        while len(self._slabs) > 1:
+            slab = self._slabs[0]
+            self._wav.write(slab)
+            self._slabs.popleft()
+            if self._spare_slab is None:
+                self._spare_slab = slab
+
+    def _discard_spool(self) -> None:
+        """Close and delete the temp WAV and drop any buffered audio."""
+        if self._wav is not None:
+            self._wav.close()
+            self._wav = None
+        if self._wav_path is not None:
+            self._wav_path.unlink(missing_ok=True)
+            self._wav_path = None
+        self._slabs.clear()
+        self._spare_slab = None
+        self._write_idx = 0
+        self._total_frames = 0
 
     def start(self) -> None:
         """Start recording."""
         if self._state != RecordingState.IDLE:
             return
 
-        self._recorded_frames = []
-        self._state = RecordingState.RECORDING
+        import sounddevice as sd
+        import soundfile as sf
+
+        # Pre-allocate the first capture slab and the spare for the first
+        # rollover so the callback never has to; later spares are recycled
+        # by the spool thread
+        slab_frames = self._quality.sample_rate * CAPTURE_SLAB_SECONDS
+        self._slabs = deque([np.empty(slab_frames, dtype=SAMPLE_DTYPE)])
+        self._spare_slab = np.empty(slab_frames, dtype=SAMPLE_DTYPE)
+        self._write_idx = 0
+        self._total_frames = 0
+
+        # Temp WAV that full slabs are spooled to while recording
+        # (always 16-bit PCM for best quality before MP3 encoding)
+        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
+            self._wav_path = Path(tmp.name)
+        self._wav = sf.SoundFile(
+            self._wav_path,
+            mode="w",
+            samplerate=self._quality.sample_rate,
+            channels=CHANNELS,
+            subtype="PCM_16",
+        )
+        self._set_state(RecordingState.RECORDING)
+
+        self._spool_stop.clear()
+        self._spool_thread = threading.Thread(target=self._spool_loop, daemon=True)
+        self._spool_thread.start()
+
+        # ~100ms blocks, rounded up to a multiple of 64 samples so the meter's
+        # vectorized reduction has no ragged tail (1600 at 16 kHz, 832 at 8 kHz)
+        blocksize = ((int(self._quality.sample_rate * 0.1) + 63) // 64) * 64
 
-        # Clear the queue
-        while not self._audio_queue.empty():
-            try:
-                self._audio_queue.get_nowait()
-            except queue.Empty:
-                break
+        # Meter scratch buffer, reused for every block of this stream, and an
+        # empty level slot so the UI never polls the previous take's level
+        self._scratch = np.empty(blocksize, dtype=np.float64)
+        self._latest_db = None
 
         # Start audio stream with current quality settings
-        self._stream = sd.InputStream(
+        self._stream = sd.RawInputStream(
             samplerate=self._quality.sample_rate,
             channels=CHANNELS,
-            dtype=self._quality.dtype,
+            dtype=SAMPLE_DTYPE,
             device=self._device_index,
             callback=self._audio_callback,
-            blocksize=int(self._quality.sample_rate * 0.1),  # 100ms blocks
+            blocksize=blocksize,
         )
         self._stream.start()
 
-        # Start recording thread
-        self._recording_thread = threading.Thread(target=self._recording_loop, daemon=True)
-        self._recording_thread.start()
-
     def pause(self) -> None:
         """Pause recording (audio stream continues for level meter)."""
         if self._state == RecordingState.RECORDING:
-            self._state = RecordingState.PAUSED
+            self._set_state(RecordingState.PAUSED)
 
     def resume(self) -> None:
         """Resume recording."""
         if self._state == RecordingState.PAUSED:
-            self._state = RecordingState.RECORDING
+            self._set_state(RecordingState.RECORDING)
 
     def stop(self) -> None:
         """Stop recording (keeps audio data for saving)."""
         if self._state in (RecordingState.RECORDING, RecordingState.PAUSED):
-            self._state = RecordingState.STOPPED
+            self._set_state(RecordingState.STOPPED)
 
             if self._stream:
                 self._stream.stop()
                 self._stream.close()
                 self._stream = None
+            self._latest_db = None
 
-            if self._recording_thread:
-                self._recording_thread.join(timeout=1.0)
-                self._recording_thread = None
+            if self._spool_thread:
+                self._spool_stop.set()
+                self._spool_thread.join()
+                self._spool_thread = None
 
     def clear(self) -> None:
         """Clear recorded audio and return to idle state."""
         self.stop()
-        with self._lock:
-            self._recorded_frames = []
-        self._state = RecordingState.IDLE
+        self._discard_spool()
+        self._set_state(RecordingState.IDLE)
 
     def get_duration(self) -> float:
         """Get current recording duration in seconds."""
-        with self._lock:
-            if not self._recorded_frames:
-                return 0.0
-            total_frames = sum(len(f) for f in self._recorded_frames)
-        return total_frames / self._quality.sample_rate
+        # Plain int read; only the audio callback increments the counter
+        return self._total_frames / self._quality.sample_rate
+
+    def snapshot(self) -> tuple[RecordingState, float]:
+        """Get the state and duration together for a single UI tick."""
+        return self._state, self.get_duration()
 
     def save(self, filepath: Path) -> Path:
         """
@@ -233,60 +382,50 @@ class AudioRecorder:
         if self._state != RecordingState.STOPPED:
             raise RuntimeError("Cannot save: recording not stopped")
 
-        with self._lock:
-            if not self._recorded_frames:
-                raise RuntimeError("Cannot save: no audio recorded")
-
-            # Concatenate all frames
-            audio_data = np.concatenate(self._recorded_frames, axis=0)
+        if not self._total_frames:
+            raise RuntimeError("Cannot save: no audio recorded")
 
         # Ensure .mp3 extension
         filepath = filepath.with_suffix(".mp3")
 
-        # Write to temporary WAV file, then convert to MP3 via ffmpeg
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
-            tmp_path = Path(tmp.name)
-
-        try:
-            # Write raw audio to temp WAV (always 16-bit PCM for best quality)
-            sf.write(
-                tmp_path,
-                audio_data,
-                self._quality.sample_rate,
-                subtype="PCM_16",
-            )
-
-            # Convert to MP3 using ffmpeg
-            cmd = [
-                "ffmpeg",
-                "-y",  # Overwrite output
-                "-i", str(tmp_path),
-                "-ac", "1",  # Mono
-                "-ar", str(self._quality.sample_rate),
-                "-b:a", f"{self._quality.mp3_bitrate}k",
-                "-codec:a", "libmp3lame",
-                str(filepath),
-            ]
-
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-            )
-
-            if result.returncode != 0:
-                raise RuntimeError(f"ffmpeg encoding failed: {result.stderr}")
-
-        finally:
-            # Clean up temp file
-            tmp_path.unlink(missing_ok=True)
-
-        # Return to idle state after saving
-        self._recorded_frames = []
-        self._state = RecordingState.IDLE
+        # Finish the temp WAV with whatever is still in memory. No lock is
+        # needed: stop() has closed the stream and joined the spool thread.
+        if self._wav is not None:
+            self._spool_full_slabs()
+            self._wav.write(self._slabs[-1][:self._write_idx])
+            self._wav.close()
+            self._wav = None
+            self._slabs.clear()
+            self._spare_slab = None
+
+        # Convert to MP3 using ffmpeg
+        cmd = [
+            "ffmpeg",
+            "-y",  # Overwrite output
+            "-i", str(self._wav_path),
+            "-ac", "1",  # Mono
+            "-ar", str(self._quality.sample_rate),
+            "-b:a", f"{self._quality.mp3_bitrate}k",
+            "-codec:a", "libmp3lame",
+            str(filepath),
+        ]
+
+        result = subprocess.run(
+            cmd,
+            capture_output=True,
+            text=True,
+        )
+
+        # On failure the temp WAV is kept so the save can be retried
+        if result.returncode != 0:
+            raise RuntimeError(f"ffmpeg encoding failed: {result.stderr}")
+
+        # Clean up temp file and return to idle state after saving
+        self._discard_spool()
+        self._set_state(RecordingState.IDLE)
 
         return filepath
 
     def generate_filename(self) -> str:
         """Generate a timestamped filename."""
-        return datetime.now().strftime("voice_note_%Y%m%d_%H%M%S")
+        return time.strftime("voice_note_%Y%m%d_%H%M%S")
@@ -4,7 +4,12 @@ import json
 from dataclasses import dataclass, field, asdict
 from enum import Enum
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
+
+try:
+    import orjson  # Optional: faster settings load/save
+except ImportError:
+    orjson = None
 
 
 class QualityPreset(Enum):
@@ -15,9 +20,9 @@ class QualityPreset(Enum):
     MAXIMUM = "maximum"        # Telephone quality, ~110 min per 20MB (24kbps)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class QualitySettings:
-    """Audio settings for a quality preset."""
+    """Audio settings for a quality preset (immutable, shared by all users)."""
 
     name: str
     sample_rate: int
@@ -25,10 +30,6 @@ class QualitySettings:
     description: str
     max_duration_str: str  # Human-readable max duration
 
-    # Internal recording format (always 16-bit for best quality before MP3 encoding)
-    sample_width: int = 2  # Bytes (always 16-bit for recording)
-    dtype: str = "int16"   # numpy dtype
-
     @property
     def bytes_per_second_mp3(self) -> int:
         """Calculate bytes per second for MP3 output."""
@@ -76,9 +77,17 @@ def get_quality_settings(preset: QualityPreset = DEFAULT_QUALITY_PRESET) -> Qual
 # Legacy constants for backward compatibility (default preset)
 CHANNELS = 1  # Always mono
 
+# Internal recording format: always 16-bit PCM for best quality before MP3
+# encoding, whatever the preset (PortAudio converts from the device format)
+SAMPLE_DTYPE = "int16"  # numpy dtype
+
 # Gemini API file size limit
 GEMINI_MAX_FILE_SIZE_MB = 20
 
+# Capture buffer settings
+CAPTURE_SLAB_SECONDS = 60  # Audio is captured into pre-allocated slabs of this length
+CAPTURE_SPOOL_INTERVAL_SECONDS = 1.0  # How often full slabs are written to disk
+
 # Volume meter settings
 METER_UPDATE_INTERVAL_MS = 100  # Update meter every 100ms
 METER_AVERAGING_SECONDS = 10  # Average over 10 seconds for stability
@@ -87,12 +96,29 @@ METER_MAX_DB = 0  # Maximum dB level shown
 METER_TARGET_MIN_DB = -30  # Target range minimum
 METER_TARGET_MAX_DB = -10  # Target range maximum
 
+# Settings persistence
+SETTINGS_SAVE_DELAY_MS = 300  # Bursts of preference changes are written once
+
 # Default paths
 DEFAULT_CONFIG_DIR = Path.home() / ".config" / "voice-note-recorder"
 DEFAULT_CONFIG_FILE = DEFAULT_CONFIG_DIR / "settings.json"
 DEFAULT_SAVE_PATH = Path.home() / "Voice Notes"
 
 
+def _json_loads(raw: bytes) -> Any:
+    """Parse JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize to indented JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode()
+
+
 @dataclass
 class Settings:
     """Application settings with persistence."""
@@ -106,8 +132,8 @@ class Settings:
         """Load settings from file, or return defaults if not found."""
         if config_file.exists():
             try:
-                with open(config_file, "r") as f:
-                    data = json.load(f)
+                with open(config_file, "rb") as f:
+                    data = _json_loads(f.read())
                 return cls(**data)
             except (json.JSONDecodeError, TypeError, KeyError):
                 pass
@@ -116,8 +142,8 @@ class Settings:
     def save(self, config_file: Path = DEFAULT_CONFIG_FILE) -> None:
         """Save settings to file."""
         config_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(config_file, "w") as f:
-            json.dump(asdict(self), f, indent=2)
+        with open(config_file, "wb") as f:
+            f.write(_json_dumps(asdict(self)))
 
     def get_save_path(self) -> Path:
         """Get the default save path, creating it if necessary."""
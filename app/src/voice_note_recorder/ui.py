@@ -1,8 +1,18 @@
 """Main UI window for the voice note recorder."""
 
 from pathlib import Path
-
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QObject
+from typing import Optional
+
+from PyQt6.QtCore import (
+    Qt,
+    QEvent,
+    QObject,
+    QRunnable,
+    QThreadPool,
+    QTimer,
+    pyqtSignal,
+    pyqtSlot,
+)
 from PyQt6.QtGui import QIcon, QAction, QShortcut, QKeySequence
 from PyQt6.QtWidgets import (
     QMainWindow,
@@ -25,6 +35,7 @@ from .audio import AudioRecorder, RecordingState
 from .config import (
     Settings,
     METER_UPDATE_INTERVAL_MS,
+    SETTINGS_SAVE_DELAY_MS,
     GEMINI_MAX_FILE_SIZE_MB,
     QualityPreset,
     QUALITY_PRESETS,
@@ -32,9 +43,243 @@ from .config import (
 from .widgets import VolumeMeter
 
 
-class LevelSignal(QObject):
-    """Signal bridge for thread-safe level updates."""
-    level_changed = pyqtSignal(float)
+# Widget and timer signals are emitted on the GUI thread, so their slots can
+# be called directly without Qt checking thread affinity per emit.
+_DIRECT = Qt.ConnectionType.DirectConnection
+
+# Pre-rendered "MM:SS" strings for the first hour of a recording
+_MMSS = tuple("%02d:%02d" % divmod(s, 60) for s in range(3600))
+
+# Light modern minimalist theme, built once at import time
+_THEME_QSS = """
+    QMainWindow {
+        background-color: #f5f5f5;
+    }
+    QWidget {
+        background-color: #f5f5f5;
+        color: #333;
+    }
+    QTabWidget::pane {
+        border: 1px solid #ddd;
+        background-color: #fff;
+    }
+    QTabBar::tab {
+        background-color: #e8e8e8;
+        color: #666;
+        padding: 8px 16px;
+        border: 1px solid #ddd;
+        border-bottom: none;
+        margin-right: 2px;
+    }
+    QTabBar::tab:selected {
+        background-color: #fff;
+        color: #333;
+        border-bottom: 1px solid #fff;
+    }
+    QTabBar::tab:hover:!selected {
+        background-color: #f0f0f0;
+    }
+    QComboBox {
+        background-color: #fff;
+        border: 1px solid #ccc;
+        border-radius: 4px;
+        padding: 6px;
+        color: #333;
+    }
+    QComboBox::drop-down {
+        border: none;
+    }
+    QComboBox QAbstractItemView {
+        background-color: #fff;
+        color: #333;
+        selection-background-color: #e3f2fd;
+    }
+    QLineEdit {
+        background-color: #fff;
+        border: 1px solid #ccc;
+        border-radius: 4px;
+        padding: 6px;
+        color: #333;
+    }
+    QPushButton {
+        background-color: #e0e0e0;
+        border: none;
+        border-radius: 4px;
+        padding: 6px 12px;
+        color: #333;
+    }
+    QPushButton:hover {
+        background-color: #d0d0d0;
+    }
+"""
+
+
+# About tab content; depends only on constants, so built once at import time
+_ABOUT_HTML = f"""
+<h3 style="color: #4CAF50;">Voice Note Recorder</h3>
+<p>A lightweight voice recorder optimized for AI transcription services
+like Google Gemini and OpenAI Whisper.</p>
+
+<h4 style="color: #2196F3;">Quality Presets</h4>
+<p>All presets output mono MP3 files optimized for speech-to-text.
+Choose based on your recording length needs:</p>
+
+<table style="margin-left: 10px;">
+<tr>
+    <td style="color: #4CAF50; font-weight: bold; padding: 8px 12px 8px 0;">Standard</td>
+    <td style="padding: 8px 0;">
+        <b>16 kHz, 64 kbps MP3</b> &mdash; ~43 min per {GEMINI_MAX_FILE_SIZE_MB} MB<br/>
+        <span style="color: #888;">Best clarity. Native sample rate for Gemini/Whisper.
+        Use for important notes where quality matters.</span>
+    </td>
+</tr>
+<tr>
+    <td style="color: #FF9800; font-weight: bold; padding: 8px 12px 8px 0;">Extended</td>
+    <td style="padding: 8px 0;">
+        <b>16 kHz, 32 kbps MP3</b> &mdash; ~85 min per {GEMINI_MAX_FILE_SIZE_MB} MB<br/>
+        <span style="color: #888;">Good quality for longer recordings.
+        Still very clear for speech. <b>Recommended default.</b></span>
+    </td>
+</tr>
+<tr>
+    <td style="color: #f44336; font-weight: bold; padding: 8px 12px 8px 0;">Maximum Duration</td>
+    <td style="padding: 8px 0;">
+        <b>8 kHz, 24 kbps MP3</b> &mdash; ~110 min per {GEMINI_MAX_FILE_SIZE_MB} MB<br/>
+        <span style="color: #888;">Telephone quality. Use for very long voice notes
+        like meeting recordings or brainstorming sessions.</span>
+    </td>
+</tr>
+</table>
+
+<h4 style="color: #2196F3; margin-top: 16px;">API Limits</h4>
+<p>Gemini's file upload limit is <b>{GEMINI_MAX_FILE_SIZE_MB} MB</b>.
+The max duration shown accounts for this limit.
+For longer recordings, consider splitting into multiple files.</p>
+
+<p style="color: #666; margin-top: 20px; font-size: 11px;">
+Built with PyQt6 and sounddevice.
+</p>
+"""
+
+
+def _build_button_qss(roles: dict[str, tuple[str, str]]) -> str:
+    """Build the rules for buttons styled by their "role" property."""
+    rules = ["""
+        QPushButton[role] {
+            color: white;
+            border: none;
+            border-radius: 4px;
+            padding: 8px 16px;
+            font-weight: bold;
+        }"""]
+    for role, (background, hover) in roles.items():
+        rules.append(
+            f'        QPushButton[role="{role}"] {{ background-color: {background}; }}\n'
+            f'        QPushButton[role="{role}"]:hover {{ background-color: {hover}; }}'
+        )
+    # Last, so it wins over the equally specific :hover rules
+    rules.append("""        QPushButton[role]:disabled {
+            background-color: #444;
+            color: #666;
+        }
+""")
+    return "\n".join(rules)
+
+
+# Labels and the About text, matched by objectName in the window stylesheet
+_LABEL_QSS = """
+    QLabel#durationLabel {
+        font-size: 32px;
+        font-weight: bold;
+        font-family: monospace;
+        color: #333;
+    }
+    QLabel#sizeLabel {
+        font-size: 14px;
+        font-family: monospace;
+        color: #666;
+    }
+    QLabel#sizeLabel[severity="idle"] { color: #888; }
+    QLabel#sizeLabel[severity="warn"] { color: #f57c00; }
+    QLabel#sizeLabel[severity="danger"] { color: #d32f2f; }
+    QLabel#maxDurationLabel { color: #888; font-size: 11px; }
+    QLabel#statusLabel { color: #666; font-size: 12px; }
+    QLabel#groupLabel { color: #333; font-weight: bold; font-size: 13px; }
+    QLabel#fieldLabel { color: #666; }
+    QLabel#qualityDescLabel { color: #888; font-size: 11px; margin-left: 60px; }
+    QFrame#hsep { background-color: #ddd; }
+    QTextBrowser#aboutText {
+        background-color: #fff;
+        color: #333;
+        border: none;
+        font-size: 12px;
+    }
+"""
+
+# Colored action buttons: role property -> (background, hover background)
+_BUTTON_ROLES = {
+    "record": ("#4CAF50", "#45a049"),
+    "pause": ("#FF9800", "#e68a00"),
+    "stop": ("#f44336", "#da190b"),
+    "clear": ("#666", "#555"),
+    "saveDefault": ("#2196F3", "#1976D2"),
+    "saveCustom": ("#607D8B", "#546E7A"),
+}
+_BUTTON_QSS = _build_button_qss(_BUTTON_ROLES)
+
+# The whole window stylesheet, so Qt parses a single string once per window
+_WINDOW_QSS = _THEME_QSS + _LABEL_QSS + _BUTTON_QSS
+
+
+class StateSignal(QObject):
+    """Signal bridge for thread-safe state updates."""
+    state_changed = pyqtSignal(object)
+
+
+class SaveSignals(QObject):
+    """Signals reporting the outcome of a SaveWorker."""
+    finished = pyqtSignal(object)
+    failed = pyqtSignal(str)
+
+
+class SaveWorker(QRunnable):
+    """Save (flush and encode) the stopped recording on a pool thread."""
+
+    def __init__(self, recorder: AudioRecorder, filepath: Path):
+        super().__init__()
+        self.signals = SaveSignals()
+        self._recorder = recorder
+        self._filepath = filepath
+
+    def run(self) -> None:
+        """Save the recording, reporting the saved path or the error."""
+        try:
+            saved_path = self._recorder.save(self._filepath)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+        else:
+            self.signals.finished.emit(saved_path)
+
+
+class DeviceSignals(QObject):
+    """Signals carrying the result of a DeviceListWorker."""
+    loaded = pyqtSignal(object)
+
+
+class DeviceListWorker(QRunnable):
+    """Enumerate input devices on a pool thread (PortAudio can be slow)."""
+
+    def __init__(self):
+        super().__init__()
+        self.signals = DeviceSignals()
+
+    def run(self) -> None:
+        """List the input devices, reporting an empty list on failure."""
+        try:
+            devices = AudioRecorder.list_devices()
+        except Exception:
+            devices = []
+        self.signals.loaded.emit(devices)
 
 
 class MainWindow(QMainWindow):
@@ -44,19 +289,40 @@ class MainWindow(QMainWindow):
         super().__init__()
 
         self.settings = Settings.load()
-        self._level_signal = LevelSignal()
-        self._level_signal.level_changed.connect(self._on_level_update)
+
+        # The recorder switches to IDLE from the save worker's thread, so
+        # state changes are routed through a signal (queued when off-thread)
+        self._state_signal = StateSignal()
+        self._state_signal.state_changed.connect(self._on_state_changed)
+        self._save_worker: Optional[SaveWorker] = None
+        # Saves get their own pool so closing waits on them alone
+        self._save_pool = QThreadPool(self)
+        self._save_pool.setMaxThreadCount(1)
+        # Set while devices are being enumerated; Record stays disabled until
+        # the preferred device is applied (and PortAudio is not re-entered)
+        self._device_worker: Optional[DeviceListWorker] = None
+        self._devices = []
+        self._device_by_name = {}
 
         self.recorder = AudioRecorder(
-            level_callback=lambda db: self._level_signal.level_changed.emit(db),
             quality_settings=self.settings.get_quality_settings(),
+            state_callback=self._state_signal.state_changed.emit,
         )
+        self._cache_quality_values()
+
+        # Last value pushed to each widget property, keyed by name, so
+        # unchanged values don't cross into Qt on every tick
+        self._ui_cache: dict[str, object] = {}
+        # Whether the meter is on screen (Record tab, window not minimized)
+        self._meter_on_screen = True
 
         self._setup_ui()
+        self._setup_dialogs()
         self._setup_shortcuts()
         self._setup_timer()
         self._load_devices()
         self._apply_settings()
+        self._on_state_changed(self.recorder.state)
 
     def _setup_ui(self) -> None:
         """Set up the user interface."""
@@ -79,6 +345,7 @@ class MainWindow(QMainWindow):
         self._setup_record_tab()
         self._setup_settings_tab()
         self._setup_about_tab()
+        self.tabs.currentChanged.connect(self._on_tab_changed, _DIRECT)
 
         # Apply dark theme
         self._apply_theme()
@@ -97,39 +364,27 @@ class MainWindow(QMainWindow):
         # Duration display (centered)
         self.duration_label = QLabel("00:00")
         self.duration_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.duration_label.setStyleSheet("""
-            QLabel {
-                font-size: 32px;
-                font-weight: bold;
-                font-family: monospace;
-                color: #333;
-            }
-        """)
+        self.duration_label.setObjectName("durationLabel")
         layout.addWidget(self.duration_label)
 
         # File size estimate (centered below duration)
         self.size_label = QLabel("0.0 MB")
         self.size_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.size_label.setStyleSheet("""
-            QLabel {
-                font-size: 14px;
-                font-family: monospace;
-                color: #666;
-            }
-        """)
+        self.size_label.setObjectName("sizeLabel")
+        self.size_label.setProperty("severity", "ok")
         layout.addWidget(self.size_label)
 
         # Max duration indicator (dynamic based on quality)
         self.max_duration_label = QLabel("")
         self.max_duration_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.max_duration_label.setStyleSheet("color: #888; font-size: 11px;")
+        self.max_duration_label.setObjectName("maxDurationLabel")
         layout.addWidget(self.max_duration_label)
         self._update_max_duration_label()
 
         # Status label
         self.status_label = QLabel("Ready to record")
         self.status_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.status_label.setStyleSheet("color: #666; font-size: 12px;")
+        self.status_label.setObjectName("statusLabel")
         layout.addWidget(self.status_label)
 
         # Main controls
@@ -138,31 +393,31 @@ class MainWindow(QMainWindow):
 
         self.record_btn = QPushButton("Record")
         self.record_btn.setMinimumHeight(40)
-        self.record_btn.clicked.connect(self._on_record)
-        self.record_btn.setStyleSheet(self._button_style("#4CAF50", "#45a049"))
+        self.record_btn.clicked.connect(self._on_record, _DIRECT)
+        self.record_btn.setProperty("role", "record")
         controls_layout.addWidget(self.record_btn)
 
         self.pause_btn = QPushButton("Pause")
         self.pause_btn.setMinimumHeight(40)
-        self.pause_btn.clicked.connect(self._on_pause)
+        self.pause_btn.clicked.connect(self._on_pause, _DIRECT)
         self.pause_btn.setEnabled(False)
-        self.pause_btn.setStyleSheet(self._button_style("#FF9800", "#e68a00"))
+        self.pause_btn.setProperty("role", "pause")
         controls_layout.addWidget(self.pause_btn)
 
         self.stop_btn = QPushButton("Stop")
         self.stop_btn.setMinimumHeight(40)
-        self.stop_btn.clicked.connect(self._on_stop)
+        self.stop_btn.clicked.connect(self._on_stop, _DIRECT)
         self.stop_btn.setEnabled(False)
-        self.stop_btn.setStyleSheet(self._button_style("#f44336", "#da190b"))
+        self.stop_btn.setProperty("role", "stop")
         controls_layout.addWidget(self.stop_btn)
 
         self.clear_btn = QPushButton("X")
         self.clear_btn.setMinimumHeight(40)
         self.clear_btn.setMaximumWidth(50)
-        self.clear_btn.clicked.connect(self._on_clear)
+        self.clear_btn.clicked.connect(self._on_clear, _DIRECT)
         self.clear_btn.setEnabled(False)
         self.clear_btn.setToolTip("Clear recording (retake)")
-        self.clear_btn.setStyleSheet(self._button_style("#666", "#555"))
+        self.clear_btn.setProperty("role", "clear")
         controls_layout.addWidget(self.clear_btn)
 
         layout.addLayout(controls_layout)
@@ -175,14 +430,14 @@ class MainWindow(QMainWindow):
 
         self.save_default_btn = QPushButton("Save to Default (Ctrl+S)")
         self.save_default_btn.setMinimumHeight(36)
-        self.save_default_btn.clicked.connect(self._on_save_default)
-        self.save_default_btn.setStyleSheet(self._button_style("#2196F3", "#1976D2"))
+        self.save_default_btn.clicked.connect(self._on_save_default, _DIRECT)
+        self.save_default_btn.setProperty("role", "saveDefault")
         save_layout.addWidget(self.save_default_btn)
 
         self.save_custom_btn = QPushButton("Save to Custom... (Ctrl+Shift+S)")
         self.save_custom_btn.setMinimumHeight(36)
-        self.save_custom_btn.clicked.connect(self._on_save_custom)
-        self.save_custom_btn.setStyleSheet(self._button_style("#607D8B", "#546E7A"))
+        self.save_custom_btn.clicked.connect(self._on_save_custom, _DIRECT)
+        self.save_custom_btn.setProperty("role", "saveCustom")
         save_layout.addWidget(self.save_custom_btn)
 
         self.save_frame.hide()
@@ -190,6 +445,7 @@ class MainWindow(QMainWindow):
 
         layout.addStretch()
         self.tabs.addTab(record_widget, "Record")
+        self._record_tab = record_widget
 
     def _setup_settings_tab(self) -> None:
         """Set up the settings tab."""
@@ -200,63 +456,71 @@ class MainWindow(QMainWindow):
 
         # Quality preset selection
         quality_group_label = QLabel("Recording Quality")
-        quality_group_label.setStyleSheet("color: #333; font-weight: bold; font-size: 13px;")
+        quality_group_label.setObjectName("groupLabel")
         layout.addWidget(quality_group_label)
 
         quality_layout = QHBoxLayout()
         quality_label = QLabel("Preset:")
-        quality_label.setStyleSheet("color: #666;")
+        quality_label.setObjectName("fieldLabel")
         quality_layout.addWidget(quality_label)
 
         self.quality_combo = QComboBox()
         self.quality_combo.setMinimumWidth(200)
-        for preset in QualityPreset:
-            settings = QUALITY_PRESETS[preset]
-            self.quality_combo.addItem(
-                f"{settings.name} ({settings.max_duration_str})",
-                preset.value
-            )
-        self.quality_combo.currentIndexChanged.connect(self._on_quality_changed)
+        # Width comes from the layout, so Qt needn't measure every item
+        self.quality_combo.setSizeAdjustPolicy(
+            QComboBox.SizeAdjustPolicy.AdjustToMinimumContentsLengthWithIcon
+        )
+        presets = list(QualityPreset)
+        self.quality_combo.addItems([
+            f"{QUALITY_PRESETS[preset].name} ({QUALITY_PRESETS[preset].max_duration_str})"
+            for preset in presets
+        ])
+        for i, preset in enumerate(presets):
+            self.quality_combo.setItemData(i, preset.value)
+        self.quality_combo.currentIndexChanged.connect(self._on_quality_changed, _DIRECT)
         quality_layout.addWidget(self.quality_combo, 1)
         layout.addLayout(quality_layout)
 
         # Quality description
         self.quality_desc_label = QLabel("")
-        self.quality_desc_label.setStyleSheet("color: #888; font-size: 11px; margin-left: 60px;")
+        self.quality_desc_label.setObjectName("qualityDescLabel")
         self.quality_desc_label.setWordWrap(True)
         layout.addWidget(self.quality_desc_label)
 
         # Separator
         separator1 = QFrame()
         separator1.setFrameShape(QFrame.Shape.HLine)
-        separator1.setStyleSheet("background-color: #ddd;")
+        separator1.setObjectName("hsep")
         layout.addWidget(separator1)
 
         # Device selection
         device_group_label = QLabel("Audio Input")
-        device_group_label.setStyleSheet("color: #333; font-weight: bold; font-size: 13px;")
+        device_group_label.setObjectName("groupLabel")
         layout.addWidget(device_group_label)
 
         device_layout = QHBoxLayout()
         device_label = QLabel("Microphone:")
-        device_label.setStyleSheet("color: #666;")
+        device_label.setObjectName("fieldLabel")
         device_layout.addWidget(device_label)
 
         self.device_combo = QComboBox()
         self.device_combo.setMinimumWidth(200)
-        self.device_combo.currentIndexChanged.connect(self._on_device_changed)
+        self.device_combo.setSizeAdjustPolicy(
+            QComboBox.SizeAdjustPolicy.AdjustToMinimumContentsLengthWithIcon
+        )
+        self.device_combo.currentIndexChanged.connect(self._on_device_changed, _DIRECT)
         device_layout.addWidget(self.device_combo, 1)
         layout.addLayout(device_layout)
 
         # Separator
         separator2 = QFrame()
         separator2.setFrameShape(QFrame.Shape.HLine)
-        separator2.setStyleSheet("background-color: #ddd;")
+        separator2.setObjectName("hsep")
         layout.addWidget(separator2)
 
         # Save path
         path_group_label = QLabel("Default Save Location")
-        path_group_label.setStyleSheet("color: #333; font-weight: bold; font-size: 13px;")
+        path_group_label.setObjectName("groupLabel")
         layout.addWidget(path_group_label)
 
         path_layout = QHBoxLayout()
@@ -265,7 +529,7 @@ class MainWindow(QMainWindow):
         path_layout.addWidget(self.path_edit, 1)
 
         self.browse_btn = QPushButton("Browse...")
-        self.browse_btn.clicked.connect(self._on_browse_path)
+        self.browse_btn.clicked.connect(self._on_browse_path, _DIRECT)
         path_layout.addWidget(self.browse_btn)
         layout.addLayout(path_layout)
 
@@ -281,62 +545,9 @@ class MainWindow(QMainWindow):
 
         about_text = QTextBrowser()
         about_text.setOpenExternalLinks(True)
-        about_text.setStyleSheet("""
-            QTextBrowser {
-                background-color: #fff;
-                color: #333;
-                border: none;
-                font-size: 12px;
-            }
-        """)
-
-        about_html = f"""
-        <h3 style="color: #4CAF50;">Voice Note Recorder</h3>
-        <p>A lightweight voice recorder optimized for AI transcription services
-        like Google Gemini and OpenAI Whisper.</p>
-
-        <h4 style="color: #2196F3;">Quality Presets</h4>
-        <p>All presets output mono MP3 files optimized for speech-to-text.
-        Choose based on your recording length needs:</p>
-
-        <table style="margin-left: 10px;">
-        <tr>
-            <td style="color: #4CAF50; font-weight: bold; padding: 8px 12px 8px 0;">Standard</td>
-            <td style="padding: 8px 0;">
-                <b>16 kHz, 64 kbps MP3</b> &mdash; ~43 min per {GEMINI_MAX_FILE_SIZE_MB} MB<br/>
-                <span style="color: #888;">Best clarity. Native sample rate for Gemini/Whisper.
-                Use for important notes where quality matters.</span>
-            </td>
-        </tr>
-        <tr>
-            <td style="color: #FF9800; font-weight: bold; padding: 8px 12px 8px 0;">Extended</td>
-            <td style="padding: 8px 0;">
-                <b>16 kHz, 32 kbps MP3</b> &mdash; ~85 min per {GEMINI_MAX_FILE_SIZE_MB} MB<br/>
-                <span style="color: #888;">Good quality for longer recordings.
-                Still very clear for speech. <b>Recommended default.</b></span>
-            </td>
-        </tr>
-        <tr>
-            <td style="color: #f44336; font-weight: bold; padding: 8px 12px 8px 0;">Maximum Duration</td>
-            <td style="padding: 8px 0;">
-                <b>8 kHz, 24 kbps MP3</b> &mdash; ~110 min per {GEMINI_MAX_FILE_SIZE_MB} MB<br/>
-                <span style="color: #888;">Telephone quality. Use for very long voice notes
-                like meeting recordings or brainstorming sessions.</span>
-            </td>
-        </tr>
-        </table>
-
-        <h4 style="color: #2196F3; margin-top: 16px;">API Limits</h4>
-        <p>Gemini's file upload limit is <b>{GEMINI_MAX_FILE_SIZE_MB} MB</b>.
-        The max duration shown accounts for this limit.
-        For longer recordings, consider splitting into multiple files.</p>
-
-        <p style="color: #666; margin-top: 20px; font-size: 11px;">
-        Built with PyQt6 and sounddevice.
-        </p>
-        """
-
-        about_text.setHtml(about_html)
+        about_text.setObjectName("aboutText")
+
+        about_text.setHtml(_ABOUT_HTML)
         layout.addWidget(about_text)
 
         self.tabs.addTab(about_widget, "About")
@@ -357,143 +568,117 @@ class MainWindow(QMainWindow):
         settings = QUALITY_PRESETS[preset]
         self.quality_desc_label.setText(settings.description)
 
+    def _setup_dialogs(self) -> None:
+        """Create the message boxes once; they are reused for every prompt."""
+        self._error_box = QMessageBox(
+            QMessageBox.Icon.Critical,
+            "Save Error",
+            "",
+            QMessageBox.StandardButton.Ok,
+            self,
+        )
+        self._close_confirm_box = QMessageBox(
+            QMessageBox.Icon.Question,
+            "Recording in Progress",
+            "A recording is in progress. Discard and exit?",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+            self,
+        )
+
+    def _show_save_error(self, message: str) -> None:
+        """Show a save error in the shared error box."""
+        self._error_box.setText(message)
+        self._error_box.exec()
+
     def _setup_shortcuts(self) -> None:
         """Set up keyboard shortcuts."""
         # Save to default (Ctrl+S) - only active when save frame is visible
         self.save_default_shortcut = QShortcut(QKeySequence("Ctrl+S"), self)
-        self.save_default_shortcut.activated.connect(self._on_shortcut_save_default)
+        self.save_default_shortcut.activated.connect(self._on_shortcut_save_default, _DIRECT)
 
         # Save to custom (Ctrl+Shift+S)
         self.save_custom_shortcut = QShortcut(QKeySequence("Ctrl+Shift+S"), self)
-        self.save_custom_shortcut.activated.connect(self._on_shortcut_save_custom)
+        self.save_custom_shortcut.activated.connect(self._on_shortcut_save_custom, _DIRECT)
 
+    @pyqtSlot()
     def _on_shortcut_save_default(self) -> None:
         """Handle Ctrl+S shortcut."""
-        if self.save_frame.isVisible():
+        if self.save_frame.isVisible() and self._save_worker is None:
             self._on_save_default()
 
+    @pyqtSlot()
     def _on_shortcut_save_custom(self) -> None:
         """Handle Ctrl+Shift+S shortcut."""
-        if self.save_frame.isVisible():
+        if self.save_frame.isVisible() and self._save_worker is None:
             self._on_save_custom()
 
-    def _button_style(self, bg_color: str, hover_color: str) -> str:
-        """Generate button stylesheet."""
-        return f"""
-            QPushButton {{
-                background-color: {bg_color};
-                color: white;
-                border: none;
-                border-radius: 4px;
-                padding: 8px 16px;
-                font-weight: bold;
-            }}
-            QPushButton:hover {{
-                background-color: {hover_color};
-            }}
-            QPushButton:disabled {{
-                background-color: #444;
-                color: #666;
-            }}
-        """
-
     def _apply_theme(self) -> None:
         """Apply light modern minimalist theme to the window."""
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #f5f5f5;
-            }
-            QWidget {
-                background-color: #f5f5f5;
-                color: #333;
-            }
-            QTabWidget::pane {
-                border: 1px solid #ddd;
-                background-color: #fff;
-            }
-            QTabBar::tab {
-                background-color: #e8e8e8;
-                color: #666;
-                padding: 8px 16px;
-                border: 1px solid #ddd;
-                border-bottom: none;
-                margin-right: 2px;
-            }
-            QTabBar::tab:selected {
-                background-color: #fff;
-                color: #333;
-                border-bottom: 1px solid #fff;
-            }
-            QTabBar::tab:hover:!selected {
-                background-color: #f0f0f0;
-            }
-            QComboBox {
-                background-color: #fff;
-                border: 1px solid #ccc;
-                border-radius: 4px;
-                padding: 6px;
-                color: #333;
-            }
-            QComboBox::drop-down {
-                border: none;
-            }
-            QComboBox QAbstractItemView {
-                background-color: #fff;
-                color: #333;
-                selection-background-color: #e3f2fd;
-            }
-            QLineEdit {
-                background-color: #fff;
-                border: 1px solid #ccc;
-                border-radius: 4px;
-                padding: 6px;
-                color: #333;
-            }
-            QPushButton {
-                background-color: #e0e0e0;
-                border: none;
-                border-radius: 4px;
-                padding: 6px 12px;
-                color: #333;
-            }
-            QPushButton:hover {
-                background-color: #d0d0d0;
-            }
-        """)
+        self.setStyleSheet(_WINDOW_QSS)
 
     def _setup_timer(self) -> None:
-        """Set up the UI update timer."""
+        """Set up the UI update timer (runs only while a stream is open)."""
         self.update_timer = QTimer()
-        self.update_timer.timeout.connect(self._update_ui)
-        self.update_timer.start(METER_UPDATE_INTERVAL_MS)
+        self.update_timer.setInterval(METER_UPDATE_INTERVAL_MS)
+        self.update_timer.timeout.connect(self._update_ui, _DIRECT)
+
+        # Debounced settings writes: each change restarts the delay
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(SETTINGS_SAVE_DELAY_MS)
+        self._save_timer.timeout.connect(self.settings.save, _DIRECT)
 
     def _load_devices(self) -> None:
-        """Load available audio devices into the combo box."""
+        """Start loading the audio devices; the combo waits on a placeholder."""
         self.device_combo.blockSignals(True)
         self.device_combo.clear()
+        self.device_combo.addItem("Loading...")
+        self.device_combo.blockSignals(False)
+        self.device_combo.setEnabled(False)
 
-        devices = self.recorder.list_devices()
-        self._devices = devices
+        worker = DeviceListWorker()
+        worker.signals.loaded.connect(self._on_devices_loaded)
+        self._device_worker = worker
+        QThreadPool.globalInstance().start(worker)
 
-        for dev in devices:
-            label = f"{dev.name}"
-            if dev.is_default:
-                label += " (Default)"
-            self.device_combo.addItem(label, dev.index)
+    @pyqtSlot(object)
+    def _on_devices_loaded(self, devices: list) -> None:
+        """Fill the device combo and select the preferred device."""
+        self._device_worker = None
+        self._devices = devices
+        self._device_by_name = {dev.name: (i, dev) for i, dev in enumerate(devices)}
+
+        labels = [
+            f"{dev.name} (Default)" if dev.is_default else dev.name
+            for dev in devices
+        ]
+
+        # Insert all rows in one go rather than one model change per device
+        combo = self.device_combo
+        combo.setUpdatesEnabled(False)
+        combo.blockSignals(True)
+        combo.clear()
+        combo.addItems(labels)
+        for i, dev in enumerate(devices):
+            combo.setItemData(i, dev.index)
 
-        self.device_combo.blockSignals(False)
+        # Select preferred device if set
+        entry = self._device_by_name.get(self.settings.preferred_device)
+        if entry:
+            i, dev = entry
+            combo.setCurrentIndex(i)
+            self.recorder.set_device(dev.index)
+        combo.blockSignals(False)
+        combo.setUpdatesEnabled(True)
+        combo.setEnabled(bool(devices))
+        self.record_btn.setEnabled(self.recorder.state == RecordingState.IDLE)
 
     def _apply_settings(self) -> None:
         """Apply loaded settings to UI."""
         self.path_edit.setText(self.settings.default_save_path)
+        self._default_save_path = Path(self.settings.default_save_path)
 
-        # Select preferred device if set
-        if self.settings.preferred_device:
-            for i, dev in enumerate(self._devices):
-                if dev.name == self.settings.preferred_device:
-                    self.device_combo.setCurrentIndex(i)
-                    self.recorder.set_device(dev.index)
-                    break
+        # The preferred device is selected once the device list has loaded
 
         # Select quality preset
         self.quality_combo.blockSignals(True)
@@ -505,42 +690,89 @@ class MainWindow(QMainWindow):
         self.quality_combo.blockSignals(False)
         self._update_quality_description()
 
-    def _on_level_update(self, db: float) -> None:
-        """Handle level updates from the audio thread."""
-        self.volume_meter.set_level(db)
-
+    @pyqtSlot()
     def _update_ui(self) -> None:
-        """Update UI elements periodically."""
-        state = self.recorder.state
-        duration = self.recorder.get_duration()
-        quality = self.recorder.quality
+        """Update the meter, duration and size display (timer tick)."""
+        state, duration = self.recorder.snapshot()
+
+        # Poll the input level while the stream is open (the audio thread
+        # only stores it, so the meter never runs on the audio thread)
+        if self._meter_on_screen and (
+            state is RecordingState.RECORDING or state is RecordingState.PAUSED
+        ):
+            # None until the first block of this take (or since metering was
+            # re-enabled) has been measured; don't feed the meter a fake level
+            level_db = self.recorder.get_level_db()
+            if level_db is not None:
+                self.volume_meter.set_level(level_db)
+                self.volume_meter.update_if_dirty()
+
+        # The labels below only change with whole seconds (the size moves in
+        # 0.1 MB steps, many seconds apart), so skip ticks within the same
+        # second, which includes every tick while paused or stopped
+        total_seconds = int(duration)
+        if self._ui_cache.get("seconds") == total_seconds:
+            return
+        self._ui_cache["seconds"] = total_seconds
 
         # Update duration display
-        minutes = int(duration // 60)
-        seconds = int(duration % 60)
-        self.duration_label.setText(f"{minutes:02d}:{seconds:02d}")
+        if total_seconds < len(_MMSS):
+            duration_text = _MMSS[total_seconds]
+        else:
+            minutes, seconds = divmod(total_seconds, 60)
+            duration_text = f"{minutes:02d}:{seconds:02d}"
+        self._set_text("duration", self.duration_label, duration_text)
 
         # Update file size estimate (using current quality's bytes per second)
-        file_size_bytes = duration * quality.bytes_per_second_mp3
-        file_size_mb = file_size_bytes / (1024 * 1024)
-        self.size_label.setText(f"{file_size_mb:.1f} MB")
+        size_text = f"{total_seconds * self._mb_per_second:.1f} MB"
+        self._set_text("size", self.size_label, size_text)
 
         # Warn if approaching Gemini limit (based on current quality's max duration)
-        max_duration = quality.max_duration_seconds
-        if duration > max_duration * 0.9:
-            self.size_label.setStyleSheet("font-size: 14px; font-family: monospace; color: #d32f2f;")
-        elif duration > max_duration * 0.75:
-            self.size_label.setStyleSheet("font-size: 14px; font-family: monospace; color: #f57c00;")
+        if total_seconds > self._danger_seconds:
+            self._set_size_severity("danger")
+        elif total_seconds > self._warn_seconds:
+            self._set_size_severity("warn")
         else:
-            self.size_label.setStyleSheet("font-size: 14px; font-family: monospace; color: #666;")
+            self._set_size_severity("ok")
 
-        # Update button states
+    def _cache_quality_values(self) -> None:
+        """Cache the quality-derived values _update_ui uses on every refresh."""
+        quality = self.recorder.quality
+        self._mb_per_second = quality.bytes_per_second_mp3 / (1024 * 1024)
+        self._warn_seconds = quality.max_duration_seconds * 0.75
+        self._danger_seconds = quality.max_duration_seconds * 0.9
+
+    def _set_text(self, key: str, widget, text: str) -> None:
+        """Set a label or button's text unless it already shows it."""
+        if self._ui_cache.get(key) != text:
+            widget.setText(text)
+            self._ui_cache[key] = text
+
+    def _set_size_severity(self, severity: str) -> None:
+        """Recolor the size label through its stylesheet severity property."""
+        if self._ui_cache.get("severity") == severity:
+            return
+        self._ui_cache["severity"] = severity
+        self.size_label.setProperty("severity", severity)
+        # Re-polish so the property selector is re-evaluated
+        style = self.size_label.style()
+        style.unpolish(self.size_label)
+        style.polish(self.size_label)
+
+    @pyqtSlot(object)
+    def _on_state_changed(self, state: RecordingState) -> None:
+        """Update buttons and status when the recorder changes state."""
         is_idle = state == RecordingState.IDLE
         is_recording = state == RecordingState.RECORDING
         is_paused = state == RecordingState.PAUSED
         is_stopped = state == RecordingState.STOPPED
 
-        self.record_btn.setEnabled(is_idle)
+        # Tick only while a stream is open; a final tick syncs the display
+        self._sync_update_timer()
+        self._update_ui()
+
+        # Update button states
+        self.record_btn.setEnabled(is_idle and self._device_worker is None)
         self.pause_btn.setEnabled(is_recording or is_paused)
         self.pause_btn.setText("Resume" if is_paused else "Pause")
         self.stop_btn.setEnabled(is_recording or is_paused)
@@ -562,11 +794,24 @@ class MainWindow(QMainWindow):
         elif is_stopped:
             self.status_label.setText("Recording complete - Save or discard")
 
+    def _sync_update_timer(self) -> None:
+        """Run the UI timer only while recording and the window is on screen."""
+        active = self.recorder.state in (RecordingState.RECORDING, RecordingState.PAUSED)
+        if active and self.isVisible() and not self.isMinimized():
+            if not self.update_timer.isActive():
+                self.update_timer.start()
+        else:
+            self.update_timer.stop()
+
+    @pyqtSlot()
     def _on_record(self) -> None:
         """Start recording."""
+        if self._device_worker is not None:
+            return  # Preferred device not applied yet
         self.recorder.start()
         self.volume_meter.reset()
 
+    @pyqtSlot()
     def _on_pause(self) -> None:
         """Toggle pause/resume."""
         if self.recorder.state == RecordingState.PAUSED:
@@ -574,53 +819,96 @@ class MainWindow(QMainWindow):
         else:
             self.recorder.pause()
 
+    @pyqtSlot()
     def _on_stop(self) -> None:
         """Stop recording."""
         self.recorder.stop()
 
+    @pyqtSlot()
     def _on_clear(self) -> None:
         """Clear the recording."""
         self.recorder.clear()
         self.volume_meter.reset()
-        self.duration_label.setText("00:00")
-        self.size_label.setText("0.0 MB")
-        self.size_label.setStyleSheet("font-size: 14px; font-family: monospace; color: #888;")
-
+        self._set_text("duration", self.duration_label, "00:00")
+        self._set_text("size", self.size_label, "0.0 MB")
+        self._set_size_severity("idle")
+        # Force the next tick to repaint the labels from scratch
+        self._ui_cache.pop("seconds", None)
+
+    def _start_save(self, filepath: Path) -> None:
+        """Save the recording on the thread pool, locking the save controls."""
+        worker = SaveWorker(self.recorder, filepath)
+        worker.signals.finished.connect(self._on_save_finished)
+        worker.signals.failed.connect(self._on_save_failed)
+        # Held until the worker reports back, which also marks a save in flight
+        self._save_worker = worker
+        self._set_save_controls_enabled(False)
+        self.status_label.setText("Saving...")
+        self._save_pool.start(worker)
+
+    def _set_save_controls_enabled(self, enabled: bool) -> None:
+        """Enable or disable the controls that act on a stopped recording."""
+        self.save_default_btn.setEnabled(enabled)
+        self.save_custom_btn.setEnabled(enabled)
+        self.clear_btn.setEnabled(enabled and self.recorder.state == RecordingState.STOPPED)
+
+    @pyqtSlot(object)
+    def _on_save_finished(self, saved_path: Path) -> None:
+        """Report a completed save."""
+        self._save_worker = None
+        self._set_save_controls_enabled(True)
+        self.status_label.setText(f"Saved: {saved_path.name}")
+
+    @pyqtSlot(str)
+    def _on_save_failed(self, message: str) -> None:
+        """Report a failed save; the recording is kept for another attempt."""
+        self._save_worker = None
+        self._set_save_controls_enabled(True)
+        self.status_label.setText("Recording complete - Save or discard")
+        self._show_save_error(message)
+
+    @pyqtSlot()
     def _on_save_default(self) -> None:
         """Save to default location."""
         try:
-            save_path = self.settings.get_save_path()
-            filename = self.recorder.generate_filename()
-            filepath = save_path / filename
-            saved_path = self.recorder.save(filepath)
-            self.status_label.setText(f"Saved: {saved_path.name}")
-        except Exception as e:
-            QMessageBox.critical(self, "Save Error", str(e))
-
+            save_path = self._default_save_path
+            save_path.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            self._show_save_error(str(e))
+            return
+        self._start_save(save_path / self.recorder.generate_filename())
+
+    @pyqtSlot()
     def _on_save_custom(self) -> None:
-        """Save to custom location."""
+        """Save to custom location (dialog opens without blocking the UI)."""
         filename = self.recorder.generate_filename() + ".mp3"
-        filepath, _ = QFileDialog.getSaveFileName(
+        dialog = QFileDialog(
             self,
             "Save Voice Note",
-            str(Path(self.settings.default_save_path) / filename),
+            self.settings.default_save_path,
             "MP3 Files (*.mp3)",
         )
-        if filepath:
-            try:
-                saved_path = self.recorder.save(Path(filepath))
-                self.status_label.setText(f"Saved: {saved_path.name}")
-            except Exception as e:
-                QMessageBox.critical(self, "Save Error", str(e))
-
+        dialog.setAcceptMode(QFileDialog.AcceptMode.AcceptSave)
+        dialog.selectFile(filename)
+        dialog.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        dialog.fileSelected.connect(self._on_custom_path_selected)
+        dialog.open()
+
+    @pyqtSlot(str)
+    def _on_custom_path_selected(self, filepath: str) -> None:
+        """Save to the location chosen in the custom save dialog."""
+        self._start_save(Path(filepath))
+
+    @pyqtSlot(int)
     def _on_device_changed(self, index: int) -> None:
         """Handle device selection change."""
         if index >= 0 and index < len(self._devices):
             device = self._devices[index]
             self.recorder.set_device(device.index)
             self.settings.preferred_device = device.name
-            self.settings.save()
+            self._save_timer.start()
 
+    @pyqtSlot(int)
     def _on_quality_changed(self, index: int) -> None:
         """Handle quality preset selection change."""
         presets = list(QualityPreset)
@@ -630,39 +918,97 @@ class MainWindow(QMainWindow):
 
             # Update recorder
             self.recorder.set_quality(quality_settings)
+            self._cache_quality_values()
 
             # Save preference
             self.settings.quality_preset = preset.value
-            self.settings.save()
+            self._save_timer.start()
 
             # Update UI elements
             self._update_quality_description()
             self._update_max_duration_label()
 
+    @pyqtSlot()
     def _on_browse_path(self) -> None:
-        """Browse for default save path."""
-        path = QFileDialog.getExistingDirectory(
+        """Browse for default save path (dialog opens without blocking the UI)."""
+        dialog = QFileDialog(
             self,
             "Select Default Save Location",
             self.settings.default_save_path,
         )
+        dialog.setFileMode(QFileDialog.FileMode.Directory)
+        dialog.setOption(QFileDialog.Option.ShowDirsOnly)
+        dialog.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        dialog.fileSelected.connect(self._on_default_path_selected)
+        dialog.open()
+
+    @pyqtSlot(str)
+    def _on_default_path_selected(self, path: str) -> None:
+        """Store the default save path chosen in the browse dialog."""
         if path:
             self.settings.default_save_path = path
-            self.settings.save()
+            self._default_save_path = Path(path)
+            self._save_timer.start()
             self.path_edit.setText(path)
 
+    def showEvent(self, event) -> None:
+        """Resume level metering and UI updates when the window is shown."""
+        super().showEvent(event)
+        self._sync_meter()
+        self._sync_update_timer()
+        self._update_ui()
+
+    def hideEvent(self, event) -> None:
+        """Skip level metering and UI updates while the window is hidden."""
+        super().hideEvent(event)
+        self._meter_on_screen = False
+        self.recorder.set_meter_enabled(False)
+        self.update_timer.stop()
+
+    def changeEvent(self, event) -> None:
+        """Pause UI updates while minimized (not every platform sends a hide)."""
+        super().changeEvent(event)
+        if event.type() == QEvent.Type.WindowStateChange:
+            self._sync_meter()
+            self._sync_update_timer()
+            if not self.isMinimized():
+                self._update_ui()
+
+    @pyqtSlot(int)
+    def _on_tab_changed(self, index: int) -> None:
+        """Meter only while the Record tab is the one showing."""
+        self._sync_meter()
+
+    def _sync_meter(self) -> None:
+        """Enable level metering and meter repaints only while on screen."""
+        on_screen = (
+            not self.isMinimized()
+            and self.tabs.currentWidget() is self._record_tab
+        )
+        if on_screen and not self._meter_on_screen and self.recorder.state in (
+            RecordingState.RECORDING, RecordingState.PAUSED
+        ):
+            # The average is stale after a gap; reseed from the next block
+            self.volume_meter.reset()
+        self._meter_on_screen = on_screen
+        self.recorder.set_meter_enabled(on_screen)
+        self.volume_meter.setUpdatesEnabled(on_screen)
+
     def closeEvent(self, event) -> None:
         """Handle window close."""
+        # Let a save in flight finish before deciding what to discard
+        self._save_pool.waitForDone()
+
         if self.recorder.state != RecordingState.IDLE:
-            reply = QMessageBox.question(
-                self,
-                "Recording in Progress",
-                "A recording is in progress. Discard and exit?",
-                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-            )
+            reply = QMessageBox.StandardButton(self._close_confirm_box.exec())
             if reply == QMessageBox.StandardButton.No:
                 event.ignore()
                 return
 
+        # Write any preference change still waiting on the debounce
+        if self._save_timer.isActive():
+            self._save_timer.stop()
+            self.settings.save()
+
         self.recorder.clear()
         event.accept()
@@ -1,9 +1,7 @@
 """Custom Qt widgets for the voice note recorder."""
 
-from collections import deque
-
-from PyQt6.QtCore import Qt, QTimer
-from PyQt6.QtGui import QPainter, QColor, QPen, QLinearGradient
+from PyQt6.QtCore import Qt, QRect, QTimer
+from PyQt6.QtGui import QPainter, QColor, QPen, QBrush, QGradient, QLinearGradient
 from PyQt6.QtWidgets import QWidget
 
 from .config import (
@@ -29,14 +27,30 @@ class VolumeMeter(QWidget):
         self.setMinimumSize(200, 40)
         self.setMaximumHeight(50)
 
-        # Level history for averaging
+        # paintEvent fills the whole rect, so Qt needn't erase it first
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent, True)
+        self.setAttribute(Qt.WidgetAttribute.WA_NoSystemBackground, True)
+        self.setAutoFillBackground(False)
+
+        # Exponential smoothing over the averaging window. alpha = 3/(n+2)
+        # gives the same mean lag, (n-1)/3 samples, as a linearly weighted
+        # average over the last n samples, so the meter feels the same.
         samples_to_keep = int(
             METER_AVERAGING_SECONDS * 1000 / METER_UPDATE_INTERVAL_MS
         )
-        self._level_history: deque[float] = deque(maxlen=samples_to_keep)
+        self._alpha = 3.0 / (samples_to_keep + 2)
+        self._has_level = False
         self._current_level_db: float = METER_MIN_DB
         self._display_level_db: float = METER_MIN_DB
 
+        # Pixel positions, recomputed only on resize (or level change).
+        # _painted_x is the bar end as of the last repaint request; the owner
+        # repaints the span between the two via update_if_dirty().
+        self._level_x = 0
+        self._painted_x = 0
+        self._target_min_x = 0
+        self._target_max_x = 0
+
         # Colors (light theme)
         self._bg_color = QColor(230, 230, 230)
         self._low_color = QColor(180, 180, 180)
@@ -45,36 +59,89 @@ class VolumeMeter(QWidget):
         self._peak_color = QColor(244, 67, 54)  # Red
         self._notch_color = QColor(80, 80, 80, 200)
 
+        # Paint resources, built once. The gradient spans the widget width
+        # in stretch-to-device coordinates, so it never needs rebuilding.
+        gradient = QLinearGradient(0, 0, 1, 0)
+        gradient.setCoordinateMode(QGradient.CoordinateMode.StretchToDeviceMode)
+        gradient.setColorAt(0, self._low_color)
+        gradient.setColorAt(self._db_to_frac(METER_TARGET_MIN_DB), self._good_color)
+        gradient.setColorAt(self._db_to_frac(METER_TARGET_MAX_DB), self._warn_color)
+        gradient.setColorAt(1, self._peak_color)
+        self._bar_brush = QBrush(gradient)
+        self._unfilled_brush = QBrush(QColor(200, 200, 200))
+        self._notch_pen = QPen(self._notch_color)
+        self._notch_pen.setWidth(2)
+        self._label_pen = QPen(QColor(100, 100, 100))
+        self._label_font = self.font()
+        self._label_font.setPointSize(8)
+        self._target_min_text = f"{METER_TARGET_MIN_DB}"
+        self._target_max_text = f"{METER_TARGET_MAX_DB}"
+
     def set_level(self, db: float) -> None:
-        """Update the current level (called from audio callback)."""
+        """
+        Update the current level (polled from the UI timer, no repaint).
+
+        Only pass levels measured from real audio blocks: the first one after
+        construction or reset() seeds the average outright.
+        """
+        previous_db = self._display_level_db
         self._current_level_db = max(METER_MIN_DB, min(METER_MAX_DB, db))
-        self._level_history.append(self._current_level_db)
 
-        # Calculate weighted average (recent values weighted more)
-        if self._level_history:
-            weights = list(range(1, len(self._level_history) + 1))
-            weighted_sum = sum(w * v for w, v in zip(weights, self._level_history))
-            total_weight = sum(weights)
-            self._display_level_db = weighted_sum / total_weight
-
-        self.update()
+        # Moving average (recent values weighted more). The first measured
+        # block level seeds it, so a take doesn't sweep up from the floor.
+        if self._has_level:
+            self._display_level_db += self._alpha * (
+                self._current_level_db - self._display_level_db
+            )
+        else:
+            self._display_level_db = self._current_level_db
+            self._has_level = True
+
+        if self._display_level_db != previous_db:
+            self._level_x = self._db_to_x(self._display_level_db, self.width())
+
+    def update_if_dirty(self) -> None:
+        """Schedule a repaint of just the span the bar end moved across."""
+        level_x = self._level_x
+        painted_x = self._painted_x
+        if level_x == painted_x:
+            return
+        self._painted_x = level_x
+        left = min(level_x, painted_x)
+        self.update(QRect(left, 0, abs(level_x - painted_x) + 1, self.height()))
 
     def reset(self) -> None:
         """Reset the meter."""
-        self._level_history.clear()
+        self._has_level = False
         self._current_level_db = METER_MIN_DB
         self._display_level_db = METER_MIN_DB
+        self._level_x = 0
+        self._painted_x = 0
         self.update()
 
+    @staticmethod
+    def _db_to_frac(db: float) -> float:
+        """Convert dB value to a fraction of the meter width."""
+        return (db - METER_MIN_DB) / (METER_MAX_DB - METER_MIN_DB)
+
     def _db_to_x(self, db: float, width: int) -> int:
         """Convert dB value to x coordinate."""
-        normalized = (db - METER_MIN_DB) / (METER_MAX_DB - METER_MIN_DB)
-        return int(normalized * width)
+        return int(self._db_to_frac(db) * width)
+
+    def resizeEvent(self, event) -> None:
+        """Recompute the cached pixel positions for the new width."""
+        super().resizeEvent(event)
+        width = self.width()
+        self._level_x = self._db_to_x(self._display_level_db, width)
+        self._painted_x = self._level_x  # Qt repaints the whole widget on resize
+        self._target_min_x = self._db_to_x(METER_TARGET_MIN_DB, width)
+        self._target_max_x = self._db_to_x(METER_TARGET_MAX_DB, width)
 
     def paintEvent(self, event) -> None:
-        """Paint the volume meter."""
+        """Paint the volume meter (Qt clips drawing to the update region)."""
+        # Only axis-aligned rects and lines at integer coordinates are drawn,
+        # so antialiasing would add cost without changing any pixels
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
         width = self.width()
         height = self.height()
@@ -84,32 +151,23 @@ class VolumeMeter(QWidget):
         # Background
         painter.fillRect(0, 0, width, height, self._bg_color)
 
-        # Calculate meter position
-        level_x = self._db_to_x(self._display_level_db, width)
-        target_min_x = self._db_to_x(METER_TARGET_MIN_DB, width)
-        target_max_x = self._db_to_x(METER_TARGET_MAX_DB, width)
+        # Meter positions (cached on resize and level change)
+        level_x = self._level_x
+        target_min_x = self._target_min_x
+        target_max_x = self._target_max_x
 
         # Draw meter bar with gradient
         if level_x > 0:
-            gradient = QLinearGradient(0, 0, width, 0)
-            gradient.setColorAt(0, self._low_color)
-            gradient.setColorAt(target_min_x / width, self._good_color)
-            gradient.setColorAt(target_max_x / width, self._warn_color)
-            gradient.setColorAt(1, self._peak_color)
-
-            painter.setBrush(gradient)
-            painter.setPen(Qt.PenStyle.NoPen)
-            painter.drawRect(margin, margin, level_x - margin, bar_height)
+            painter.fillRect(margin, margin, level_x - margin, bar_height, self._bar_brush)
 
         # Draw unfilled portion
-        painter.setBrush(QColor(200, 200, 200))
         if level_x < width - margin:
-            painter.drawRect(level_x, margin, width - level_x - margin, bar_height)
+            painter.fillRect(
+                level_x, margin, width - level_x - margin, bar_height, self._unfilled_brush
+            )
 
         # Draw target range notches
-        pen = QPen(self._notch_color)
-        pen.setWidth(2)
-        painter.setPen(pen)
+        painter.setPen(self._notch_pen)
 
         # Min target notch
         painter.drawLine(target_min_x, 0, target_min_x, height)
@@ -117,13 +175,11 @@ class VolumeMeter(QWidget):
         painter.drawLine(target_max_x, 0, target_max_x, height)
 
         # Draw dB labels
-        painter.setPen(QColor(100, 100, 100))
-        font = painter.font()
-        font.setPointSize(8)
-        painter.setFont(font)
+        painter.setPen(self._label_pen)
+        painter.setFont(self._label_font)
 
         # Label at target positions
-        painter.drawText(target_min_x - 15, height - 2, f"{METER_TARGET_MIN_DB}")
-        painter.drawText(target_max_x - 15, height - 2, f"{METER_TARGET_MAX_DB}")
+        painter.drawText(target_min_x - 15, height - 2, self._target_min_text)
+        painter.drawText(target_max_x - 15, height - 2, self._target_max_text)
 
         painter.end()